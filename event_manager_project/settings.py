@@ -58,6 +58,10 @@ SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": True,
 }
 
+# Events that ended longer ago than this are moved out of the hot tables
+# by `manage.py archive_events`.
+EVENT_ARCHIVE_HORIZON = timedelta(days=365)
+
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
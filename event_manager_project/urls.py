@@ -13,6 +13,7 @@ from events.views import (
     UserCreate,
     EventViewSet,
     custom_api_root,
+    event_stats,
     register_for_event,
     unregister_from_event,
 )
@@ -42,6 +43,7 @@ urlpatterns = [
         EventViewSet.as_view({"get": "list", "post": "create"}),
         name="event-list",
     ),
+    path("events/stats/", event_stats, name="event-stats"),
     path(
         "events/<int:pk>/",
         EventViewSet.as_view(
@@ -1,4 +1,21 @@
 from django.contrib import admin
-from .models import Event
+from .models import ArchivedEvent, Event, EventStats
 
 admin.site.register(Event)
+admin.site.register(EventStats)
+
+
+@admin.register(ArchivedEvent)
+class ArchivedEventAdmin(admin.ModelAdmin):
+    """
+    Archived events are read-only; EventStats is not updated for them.
+    """
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
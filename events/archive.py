@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from . import stats
+from .models import ArchivedEvent, Event
+
+
+ARCHIVED_FIELDS = ("id", "name", "description", "start_date", "end_date", "creator_id")
+
+
+def archive_horizon():
+    return getattr(settings, "EVENT_ARCHIVE_HORIZON", timedelta(days=365))
+
+
+def archive_cutoff():
+    """
+    Events that ended before this moment belong in the archive.
+    """
+    return timezone.now() - archive_horizon()
+
+
+def archive_batch(before, batch_size):
+    """
+    Move up to batch_size events that ended before `before`, with their
+    attendance rows, into the archive tables. Returns the number moved.
+    """
+    with transaction.atomic():
+        events = list(
+            Event.objects.filter(end_date__lt=before)
+            .order_by("pk")
+            .values(*ARCHIVED_FIELDS)[:batch_size]
+        )
+        if not events:
+            return 0
+        ids = [event["id"] for event in events]
+        attendance = Event.attendees.through.objects.filter(event_id__in=ids)
+
+        ArchivedEvent.objects.bulk_create(ArchivedEvent(**event) for event in events)
+        ArchivedEvent.attendees.through.objects.bulk_create(
+            ArchivedEvent.attendees.through(archivedevent_id=event_id, user_id=user_id)
+            for event_id, user_id in attendance.values_list("event_id", "user_id")
+        )
+        # Archived events keep counting towards their periods.
+        with stats.suspended():
+            Event.objects.filter(pk__in=ids).delete()
+    return len(events)
+
+
+def archive_events(before=None, batch_size=1000):
+    """
+    Archive every event that ended before `before`, one batch per transaction.
+    """
+    if before is None:
+        before = archive_cutoff()
+    total = 0
+    while True:
+        moved = archive_batch(before, batch_size)
+        if not moved:
+            return total
+        total += moved
@@ -1,5 +1,5 @@
 import django_filters
-from .models import Event
+from .models import ArchivedEvent, Event
 
 
 class EventFilter(django_filters.FilterSet):
@@ -11,3 +11,10 @@ class EventFilter(django_filters.FilterSet):
 
         model = Event
         fields = ["name", "start_date", "end_date"]
+
+
+class ArchivedEventFilter(EventFilter):
+
+    class Meta(EventFilter.Meta):
+
+        model = ArchivedEvent
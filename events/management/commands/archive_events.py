@@ -0,0 +1,32 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from events.archive import archive_cutoff, archive_events
+
+
+class Command(BaseCommand):
+    help = "Move ended events and their attendance into the archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Archive events that ended more than this many days ago "
+            "(defaults to the EVENT_ARCHIVE_HORIZON setting).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of events moved per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] is None:
+            before = archive_cutoff()
+        else:
+            before = timezone.now() - timedelta(days=options["days"])
+        archived = archive_events(before=before, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} events."))
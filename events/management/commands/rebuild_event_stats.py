@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from events.stats import rebuild_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild the precomputed event statistics from the events tables."
+
+    def handle(self, *args, **options):
+        rows = rebuild_stats()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} event stats rows."))
@@ -0,0 +1,82 @@
+# Generated by Django 5.0.2 on 2026-10-19 12:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, DateField
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+
+
+def backfill_event_stats(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    EventStats = apps.get_model("events", "EventStats")
+    trunc_functions = {"day": TruncDay, "week": TruncWeek, "month": TruncMonth}
+    for bucket, trunc in trunc_functions.items():
+        aggregates = (
+            Event.objects.annotate(
+                period_start=trunc("start_date", output_field=DateField())
+            )
+            .values("creator_id", "period_start")
+            .annotate(
+                event_count=Count("id", distinct=True),
+                attendee_count=Count("attendees"),
+            )
+            .order_by()
+        )
+        EventStats.objects.bulk_create(
+            EventStats(bucket=bucket, **aggregate) for aggregate in aggregates
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "bucket",
+                    models.CharField(
+                        choices=[("day", "Day"), ("week", "Week"), ("month", "Month")],
+                        max_length=5,
+                    ),
+                ),
+                ("period_start", models.DateField()),
+                ("event_count", models.IntegerField(default=0)),
+                ("attendee_count", models.IntegerField(default=0)),
+                (
+                    "creator",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="event_stats",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["bucket", "period_start", "creator"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="eventstats",
+            constraint=models.UniqueConstraint(
+                fields=("bucket", "period_start", "creator"),
+                name="unique_event_stats_bucket",
+            ),
+        ),
+        migrations.RunPython(backfill_event_stats, migrations.RunPython.noop),
+    ]
@@ -12,3 +12,51 @@ class Event(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class ArchivedEvent(models.Model):
+    """
+    An ended event moved out of the hot tables by the archive_events command.
+    Keeps the original primary key so event URLs stay valid.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    name = models.CharField(max_length=100)
+    description = models.TextField()
+    start_date = models.DateTimeField()
+    end_date = models.DateTimeField(db_index=True)
+    creator = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="archived_events"
+    )
+    attendees = models.ManyToManyField(User, related_name="archived_registered_events")
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
+
+
+class EventStats(models.Model):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    BUCKET_CHOICES = [(DAY, "Day"), (WEEK, "Week"), (MONTH, "Month")]
+
+    bucket = models.CharField(max_length=5, choices=BUCKET_CHOICES)
+    period_start = models.DateField()
+    creator = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="event_stats"
+    )
+    event_count = models.IntegerField(default=0)
+    attendee_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["bucket", "period_start", "creator"],
+                name="unique_event_stats_bucket",
+            )
+        ]
+        ordering = ["bucket", "period_start", "creator"]
+
+    def __str__(self):
+        return f"{self.bucket} {self.period_start} {self.creator}"
@@ -1,7 +1,7 @@
 from django.contrib.auth.models import User
 from rest_framework import serializers
 
-from .models import Event
+from .models import ArchivedEvent, Event, EventStats
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -22,3 +22,25 @@ class EventSerializer(serializers.ModelSerializer):
         model = Event
         fields = "__all__"
         read_only_fields = ("attendees", "creator")
+
+
+class ArchivedEventSerializer(EventSerializer):
+    class Meta(EventSerializer.Meta):
+        model = ArchivedEvent
+        fields = (
+            "id",
+            "creator",
+            "name",
+            "description",
+            "start_date",
+            "end_date",
+            "attendees",
+        )
+
+
+class EventStatsSerializer(serializers.ModelSerializer):
+    creator = serializers.ReadOnlyField(source="creator.username")
+
+    class Meta:
+        model = EventStats
+        fields = ("bucket", "period_start", "creator", "event_count", "attendee_count")
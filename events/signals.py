@@ -0,0 +1,106 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import m2m_changed, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .models import Event
+from .stats import apply_delta, is_suspended, to_datetime
+
+BUCKET_FIELDS = {"creator", "creator_id", "start_date"}
+
+
+def _may_change_bucket(update_fields):
+    return update_fields is None or not BUCKET_FIELDS.isdisjoint(update_fields)
+
+
+@receiver(pre_save, sender=Event)
+def remember_previous_bucket(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance.pk is None or not _may_change_bucket(update_fields):
+        return
+    instance._stats_previous = (
+        Event.objects.filter(pk=instance.pk)
+        .values_list("creator_id", "start_date")
+        .first()
+    )
+
+
+@receiver(post_save, sender=Event)
+def update_stats_on_save(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    if raw or not (created or _may_change_bucket(update_fields)):
+        return
+    previous = getattr(instance, "_stats_previous", None)
+    instance._stats_previous = None
+    if created or previous is None:
+        apply_delta(instance.creator_id, instance.start_date, events=1)
+        return
+
+    current = (instance.creator_id, instance.start_date)
+    creator_id, start_date = previous
+    if creator_id == current[0] and start_date == to_datetime(current[1]):
+        return
+    attendees = instance.attendees.count()
+    apply_delta(creator_id, start_date, events=-1, attendees=-attendees)
+    apply_delta(*current, events=1, attendees=attendees)
+
+
+@receiver(pre_delete, sender=Event)
+def update_stats_on_delete(sender, instance, **kwargs):
+    if is_suspended():
+        return
+    apply_delta(
+        instance.creator_id,
+        instance.start_date,
+        events=-1,
+        attendees=-instance.attendees.count(),
+    )
+
+
+@receiver(pre_delete, sender=User)
+def update_stats_on_attendee_delete(sender, instance, **kwargs):
+    # The attendees rows of a deleted user vanish without m2m_changed.
+    # Events the user created are handled by update_stats_on_delete.
+    for events in (instance.registered_events, instance.archived_registered_events):
+        events = events.exclude(creator=instance)
+        for creator_id, start_date in events.values_list("creator_id", "start_date"):
+            apply_delta(creator_id, start_date, attendees=-1)
+
+
+def _attendance(instance, reverse, pk_set):
+    """
+    Return (creator_id, start_date, attendees) for every event whose
+    attendance is affected; pk_set of None means all current rows.
+    """
+    if not reverse:
+        attendees = instance.attendees.all()
+        if pk_set is not None:
+            attendees = attendees.filter(pk__in=pk_set)
+        return [(instance.creator_id, instance.start_date, attendees.count())]
+
+    events = instance.registered_events.all()
+    if pk_set is not None:
+        events = events.filter(pk__in=pk_set)
+    return [
+        (creator_id, start_date, 1)
+        for creator_id, start_date in events.values_list("creator_id", "start_date")
+    ]
+
+
+@receiver(m2m_changed, sender=Event.attendees.through)
+def update_stats_on_attendance(sender, instance, action, reverse, pk_set, **kwargs):
+    if action in ("pre_remove", "pre_clear"):
+        # Django reports every requested pk on removal, so count the rows
+        # that actually exist before they are deleted.
+        instance._stats_removed = _attendance(instance, reverse, pk_set)
+    elif action in ("post_remove", "post_clear"):
+        for creator_id, start_date, attendees in instance._stats_removed:
+            apply_delta(creator_id, start_date, attendees=-attendees)
+        instance._stats_removed = []
+    elif action == "post_add" and pk_set:
+        # pk_set only holds the newly added rows here.
+        if not reverse:
+            apply_delta(instance.creator_id, instance.start_date, attendees=len(pk_set))
+            return
+        events = Event.objects.filter(pk__in=pk_set)
+        for creator_id, start_date in events.values_list("creator_id", "start_date"):
+            apply_delta(creator_id, start_date, attendees=1)
@@ -0,0 +1,123 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, DateField, F
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from django.utils import timezone
+
+from .models import ArchivedEvent, Event, EventStats
+
+
+TRUNC_FUNCTIONS = {
+    EventStats.DAY: TruncDay,
+    EventStats.WEEK: TruncWeek,
+    EventStats.MONTH: TruncMonth,
+}
+
+_suspended = ContextVar("event_stats_suspended", default=False)
+
+
+@contextmanager
+def suspended():
+    """
+    Skip incremental updates, e.g. while events move into the archive
+    and therefore still count towards their periods.
+    """
+    token = _suspended.set(True)
+    try:
+        yield
+    finally:
+        _suspended.reset(token)
+
+
+def is_suspended():
+    return _suspended.get()
+
+
+def to_datetime(value):
+    """
+    Event.start_date may still be a string right after objects.create().
+    """
+    return Event._meta.get_field("start_date").to_python(value)
+
+
+def period_start(bucket, start_date):
+    day = timezone.localtime(to_datetime(start_date)).date()
+    if bucket == EventStats.WEEK:
+        return day - timedelta(days=day.weekday())
+    if bucket == EventStats.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def apply_delta(creator_id, start_date, events=0, attendees=0):
+    """
+    Add the given deltas to every bucket row the event falls into.
+    """
+    if is_suspended() or (not events and not attendees):
+        return
+    with transaction.atomic():
+        for bucket in TRUNC_FUNCTIONS:
+            lookup = {
+                "bucket": bucket,
+                "period_start": period_start(bucket, start_date),
+                "creator_id": creator_id,
+            }
+            # Decrements never create rows, so deletions cascading from a
+            # User cannot leave new rows behind for the deleted creator.
+            if events > 0 or attendees > 0:
+                EventStats.objects.get_or_create(**lookup)
+            EventStats.objects.filter(**lookup).update(
+                event_count=F("event_count") + events,
+                attendee_count=F("attendee_count") + attendees,
+            )
+            # Drop emptied rows so the table matches what rebuild_stats produces.
+            if events < 0 or attendees < 0:
+                EventStats.objects.filter(
+                    event_count=0, attendee_count=0, **lookup
+                ).delete()
+
+
+def rebuild_stats():
+    """
+    Recompute all EventStats rows from the hot and archived events tables.
+    """
+    totals = {}
+    for model in (Event, ArchivedEvent):
+        for bucket, trunc in TRUNC_FUNCTIONS.items():
+            aggregates = (
+                model.objects.annotate(
+                    period_start=trunc("start_date", output_field=DateField())
+                )
+                .values("creator_id", "period_start")
+                .annotate(
+                    event_count=Count("id", distinct=True),
+                    attendee_count=Count("attendees"),
+                )
+                .order_by()
+            )
+            for aggregate in aggregates:
+                key = (bucket, aggregate["creator_id"], aggregate["period_start"])
+                events, attendees = totals.get(key, (0, 0))
+                totals[key] = (
+                    events + aggregate["event_count"],
+                    attendees + aggregate["attendee_count"],
+                )
+
+    rows = [
+        EventStats(
+            bucket=bucket,
+            creator_id=creator_id,
+            period_start=period_start,
+            event_count=events,
+            attendee_count=attendees,
+        )
+        for (bucket, creator_id, period_start), (events, attendees) in totals.items()
+    ]
+
+    with transaction.atomic():
+        EventStats.objects.all().delete()
+        EventStats.objects.bulk_create(rows)
+    return len(rows)
@@ -1,8 +1,13 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth.models import User
-from .models import Event
+from .models import ArchivedEvent, Event, EventStats
 
 
 class UserAccountTests(APITestCase):
@@ -176,3 +181,227 @@ class UserEventRegistrationTests(APITestCase):
         response = self.client.post(url, {}, format="json")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertFalse(self.event.attendees.filter(pk=self.user.pk).exists())
+
+
+class EventStatsTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="statsuser", password="statspassword"
+        )
+        self.attendee = User.objects.create_user(
+            username="attendee", password="attendeepassword"
+        )
+        self.event = Event.objects.create(
+            name="Stats Event",
+            description="Counted event",
+            start_date="2023-03-15T10:00:00Z",
+            end_date="2023-03-15T12:00:00Z",
+            creator=self.user,
+        )
+        Event.objects.create(
+            name="Same Week Event",
+            description="Counted event",
+            start_date="2023-03-17T10:00:00Z",
+            end_date="2023-03-17T12:00:00Z",
+            creator=self.user,
+        )
+
+    def get_stats(self, bucket, period_start):
+        return EventStats.objects.get(
+            bucket=bucket, period_start=period_start, creator=self.user
+        )
+
+    def test_stats_follow_event_saves(self):
+        self.assertEqual(self.get_stats("day", date(2023, 3, 15)).event_count, 1)
+        self.assertEqual(self.get_stats("week", date(2023, 3, 13)).event_count, 2)
+        self.assertEqual(self.get_stats("month", date(2023, 3, 1)).event_count, 2)
+
+        self.event.attendees.add(self.attendee)
+        self.event.start_date = "2023-04-02T10:00:00Z"
+        self.event.save()
+        self.assertEqual(self.get_stats("month", date(2023, 3, 1)).event_count, 1)
+        self.assertEqual(self.get_stats("month", date(2023, 3, 1)).attendee_count, 0)
+        self.assertEqual(self.get_stats("month", date(2023, 4, 1)).event_count, 1)
+        self.assertEqual(self.get_stats("month", date(2023, 4, 1)).attendee_count, 1)
+        self.assertFalse(
+            EventStats.objects.filter(period_start=date(2023, 3, 15)).exists()
+        )
+
+        self.event.name = "Renamed Event"
+        with self.assertNumQueries(1):
+            self.event.save(update_fields=["name"])
+        self.assertEqual(self.get_stats("month", date(2023, 4, 1)).event_count, 1)
+
+        self.event.delete()
+        self.assertFalse(
+            EventStats.objects.filter(period_start=date(2023, 4, 1)).exists()
+        )
+
+    def test_stats_follow_attendance_changes(self):
+        self.event.attendees.add(self.attendee, self.user)
+        self.event.attendees.add(self.attendee)
+        self.assertEqual(self.get_stats("day", date(2023, 3, 15)).attendee_count, 2)
+
+        self.attendee.registered_events.remove(self.event)
+        self.event.attendees.remove(self.attendee)
+        self.assertEqual(self.get_stats("day", date(2023, 3, 15)).attendee_count, 1)
+
+        self.event.attendees.clear()
+        self.assertEqual(self.get_stats("day", date(2023, 3, 15)).attendee_count, 0)
+
+        self.event.attendees.add(self.attendee)
+        self.attendee.delete()
+        self.assertEqual(self.get_stats("day", date(2023, 3, 15)).attendee_count, 0)
+
+    def test_rebuild_matches_incremental_stats(self):
+        self.event.attendees.add(self.attendee, self.user)
+        self.event.start_date = "2023-04-02T10:00:00Z"
+        self.event.save()
+        self.event.attendees.remove(self.user)
+        Event.objects.get(name="Same Week Event").delete()
+        expected = list(
+            EventStats.objects.values_list(
+                "bucket", "period_start", "creator", "event_count", "attendee_count"
+            )
+        )
+        EventStats.objects.all().delete()
+        call_command("rebuild_event_stats", stdout=StringIO())
+        rebuilt = list(
+            EventStats.objects.values_list(
+                "bucket", "period_start", "creator", "event_count", "attendee_count"
+            )
+        )
+        self.assertEqual(rebuilt, expected)
+
+    def test_stats_endpoint(self):
+        response = self.client.get(reverse("event-stats") + "?bucket=week")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["period_start"], "2023-03-13")
+        self.assertEqual(response.data[0]["creator"], "statsuser")
+        self.assertEqual(response.data[0]["event_count"], 2)
+
+        response = self.client.get(reverse("event-stats") + "?bucket=year")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class EventArchiveTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="archiveuser", password="archivepassword"
+        )
+        self.old_events = [
+            Event.objects.create(
+                name=f"Old Event {day}",
+                description="Long finished",
+                start_date=f"2020-05-0{day}T10:00:00Z",
+                end_date=f"2020-05-0{day}T12:00:00Z",
+                creator=self.user,
+            )
+            for day in (1, 2, 3)
+        ]
+        self.old_events[0].attendees.add(self.user)
+        self.upcoming_event = Event.objects.create(
+            name="Upcoming Event",
+            description="Still ahead",
+            start_date="2099-01-01T10:00:00Z",
+            end_date="2099-01-01T12:00:00Z",
+            creator=self.user,
+        )
+
+    def archive(self, *args):
+        call_command("archive_events", *args, stdout=StringIO())
+
+    def test_archive_moves_ended_events_and_attendance(self):
+        stats = list(EventStats.objects.values_list("event_count", "attendee_count"))
+        self.archive("--batch-size", "2")
+
+        self.assertEqual(list(Event.objects.all()), [self.upcoming_event])
+        self.assertEqual(ArchivedEvent.objects.count(), 3)
+        archived = ArchivedEvent.objects.get(pk=self.old_events[0].pk)
+        self.assertEqual(list(archived.attendees.all()), [self.user])
+        self.assertEqual(
+            list(EventStats.objects.values_list("event_count", "attendee_count")),
+            stats,
+        )
+
+        call_command("rebuild_event_stats", stdout=StringIO())
+        self.assertEqual(
+            list(EventStats.objects.values_list("event_count", "attendee_count")),
+            stats,
+        )
+
+    def test_archive_respects_horizon(self):
+        self.archive("--days", "36500")
+        self.assertEqual(Event.objects.count(), 4)
+        self.assertFalse(ArchivedEvent.objects.exists())
+
+    def test_list_includes_archive_only_for_past_dates(self):
+        self.archive()
+
+        response = self.client.get(reverse("event-list"), format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([event["name"] for event in response.data], ["Upcoming Event"])
+
+        url = reverse("event-list") + "?start_date=2020-05-02"
+        response = self.client.get(url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [event["name"] for event in response.data],
+            ["Old Event 2", "Old Event 3", "Upcoming Event"],
+        )
+
+        url = reverse("event-list") + "?end_date=2098-01-01"
+        response = self.client.get(url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [event["name"] for event in response.data],
+            ["Old Event 1", "Old Event 2", "Old Event 3"],
+        )
+
+        for name in ("Old Timers Meetup", "Newcomers Meetup"):
+            Event.objects.create(
+                name=name,
+                description="Recent event",
+                start_date="2090-01-01T10:00:00Z",
+                end_date="2090-01-01T12:00:00Z",
+                creator=self.user,
+            )
+        url = reverse("event-list") + "?name=old&end_date=2098-01-01"
+        response = self.client.get(url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [event["name"] for event in response.data],
+            ["Old Event 1", "Old Event 2", "Old Event 3", "Old Timers Meetup"],
+        )
+
+    def test_list_uses_archived_boundary_not_setting(self):
+        now = timezone.now()
+        ended = Event.objects.create(
+            name="Ended Event",
+            description="Ended 100 days ago",
+            start_date=now - timedelta(days=101),
+            end_date=now - timedelta(days=100),
+            creator=self.user,
+        )
+        self.archive("--days", "30")
+        self.assertTrue(ArchivedEvent.objects.filter(pk=ended.pk).exists())
+
+        start_date = (now - timedelta(days=200)).date().isoformat()
+        url = reverse("event-list") + f"?start_date={start_date}"
+        response = self.client.get(url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [event["name"] for event in response.data],
+            ["Upcoming Event", "Ended Event"],
+        )
+
+    def test_retrieve_archived_event(self):
+        self.archive()
+        url = reverse("event-detail", kwargs={"pk": self.old_events[0].pk})
+        response = self.client.get(url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["name"], "Old Event 1")
+        self.assertEqual(response.data["attendees"], [self.user.pk])
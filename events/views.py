@@ -2,15 +2,23 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.reverse import reverse
 from rest_framework import viewsets
+from django.db.models import Max
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 
-from .models import Event
-from .filters import EventFilter
-from .serializers import EventSerializer, UserSerializer
+from .models import ArchivedEvent, Event, EventStats
+from .filters import ArchivedEventFilter, EventFilter
+from .serializers import (
+    ArchivedEventSerializer,
+    EventSerializer,
+    EventStatsSerializer,
+    UserSerializer,
+)
 
 from rest_framework import permissions
 
@@ -46,6 +54,45 @@ class EventViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(creator=self.request.user)
 
+    def asks_for_past_dates(self):
+        """
+        Archived events are only read when a date filter can match them:
+        any end_date upper bound, or a start_date no later than the newest
+        archived end_date, whatever horizon the archive was filled with.
+        """
+        filterset = self.filterset_class(
+            self.request.query_params, queryset=self.get_queryset()
+        )
+        if not filterset.is_valid():
+            return False
+        start_date = filterset.form.cleaned_data.get("start_date")
+        end_date = filterset.form.cleaned_data.get("end_date")
+        if end_date is not None:
+            return True
+        if start_date is None:
+            return False
+        latest = ArchivedEvent.objects.aggregate(latest=Max("end_date"))["latest"]
+        return latest is not None and start_date <= timezone.localtime(latest).date()
+
+    def list(self, request, *args, **kwargs):
+        if not self.asks_for_past_dates():
+            return super().list(request, *args, **kwargs)
+
+        events = self.filter_queryset(self.get_queryset())
+        archived = ArchivedEventFilter(
+            request.query_params, queryset=ArchivedEvent.objects.all()
+        ).qs
+        data = list(self.get_serializer(events, many=True).data)
+        data += ArchivedEventSerializer(archived, many=True).data
+        return Response(sorted(data, key=lambda event: event["id"]))
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            archived = get_object_or_404(ArchivedEvent, pk=kwargs["pk"])
+            return Response(ArchivedEventSerializer(archived).data)
+
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
@@ -63,6 +110,26 @@ def unregister_from_event(request, pk):
     return Response({"message": "You have successfully unregistered from the event."})
 
 
+@api_view(["GET"])
+def event_stats(request):
+    """
+    Precomputed event and attendance totals per creator and period.
+    """
+    bucket = request.query_params.get("bucket", EventStats.DAY)
+    buckets = dict(EventStats.BUCKET_CHOICES)
+    if bucket not in buckets:
+        return Response(
+            {"bucket": f"Must be one of: {', '.join(buckets)}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    stats = EventStats.objects.filter(bucket=bucket).select_related("creator")
+    creator = request.query_params.get("creator")
+    if creator:
+        stats = stats.filter(creator__username=creator)
+    serializer = EventStatsSerializer(stats, many=True)
+    return Response(serializer.data)
+
+
 @api_view(["GET"])
 def custom_api_root(request, format=None):
     base_url = request.build_absolute_uri("/")[:-1]
@@ -98,6 +165,11 @@ def custom_api_root(request, format=None):
                 "methods": ["POST"],
                 "description": "Register a new user. POST required user information.",
             },
+            "event-stats": {
+                "url": reverse("event-stats", request=request, format=format),
+                "methods": ["GET"],
+                "description": "Event and attendance totals. Use ?bucket=day|week|month.",
+            },
             "event-register": {
                 "url": f"{base_url}/events/{{pk}}/register/",
                 "methods": ["POST"],